@@ -8,17 +8,24 @@ This bot creates continuous activity on the blockchain:
 3. Triggers block production
 
 Usage:
+  pip install aiohttp orjson
   python3 faucet_bot.py
 
 Settings:
   - INTERVAL_MIN: Minimum wait time (seconds)
   - INTERVAL_MAX: Maximum wait time (seconds)
+  - LATENCY_FACTOR: Wait time as a multiple of the average RPC latency
   - MIN_AMOUNT: Minimum transfer amount (ANV)
   - MAX_AMOUNT: Maximum transfer amount (ANV)
+  - BATCH_SIZE: Transfers sent per JSON-RPC batch request
+  - MAX_INFLIGHT: Batch requests allowed in flight at once
+  - CONFIRM_INTERVAL: How often pending transactions are checked (seconds)
+  - CONFIRM_TIMEOUT: Time after which an unmined transaction is dropped (seconds)
 """
 
-import requests
-import json
+import aiohttp
+import asyncio
+import orjson
 import random
 import time
 import sys
@@ -32,7 +39,7 @@ FAUCET_PRIVATE_KEY = (
 )
 
 # Random transfer targets (dummy addresses)
-TARGET_ADDRESSES = [
+TARGET_ADDRESSES = (
     "0x742d35Cc6634C0532925a3b844Bc9e7595f0bEb0",
     "0x8ba1f109551bD432803012645Ac136ddd64DBA72",
     "0xdD870fA1b7C4700F2BD7f44238821C26f7392148",
@@ -43,134 +50,364 @@ TARGET_ADDRESSES = [
     "0x4DE710A8E6A96849Cf15D54B208e6C548aF2E3F4",
     "0x5EF820B9F7BA0706A1c4D8c59e3D4A0c40aF3e6b",
     "0x6aD931F4c8AB1507a3b2C5d6E7F8A9B0C1D2E3F4",
-]
+)
 
-# Timing configuration
+# Timing configuration (adaptive: shrinks while the node answers quickly,
+# doubles on errors or backpressure)
 INTERVAL_MIN = 5  # Minimum 5 seconds
-INTERVAL_MAX = 25  # Maximum 25 seconds (average 15s)
+INTERVAL_MAX = 25  # Maximum 25 seconds
+LATENCY_FACTOR = 4  # Wait at least 4x the average RPC latency
+LATENCY_ALPHA = 0.2  # EWMA smoothing factor for RPC latency
+INTERVAL_DECAY = 0.8  # Per-success decay toward the latency-based target
 
 # Transfer amounts
 MIN_AMOUNT = 0.001  # 0.001 ANV
 MAX_AMOUNT = 0.1  # 0.1 ANV
 
+# Amounts are drawn as whole micro-ANV so the wei value stays integer math
+MICRO_PER_ANV = 10**6
+WEI_PER_MICRO = 10**12  # 18 decimals
+AMOUNT_RANGE_MICRO = range(
+    round(MIN_AMOUNT * MICRO_PER_ANV), round(MAX_AMOUNT * MICRO_PER_ANV) + 1
+)
 
-class FaucetBot:
-    def __init__(self):
-        self.tx_count = 0
-        self.total_transferred = 0.0
-        self.start_time = time.time()
+# Batching (one JSON-RPC 2.0 batch array per POST)
+BATCH_SIZE = 20  # Transfers per batch (node caps batches at MAX_BATCH_SIZE)
+MAX_BATCH_BYTES = 64 * 1024  # Some nodes cap the request body size
+MAX_INFLIGHT = 4  # Concurrent batch requests
+
+# merklith_transfer request with the fixed parts pre-rendered; only the
+# target, the wei amount and the id are filled in per transfer
+TRANSFER_TEMPLATE = (
+    b'{"jsonrpc":"2.0","method":"merklith_transfer","params":["'
+    + FAUCET_ADDRESS.encode()
+    + b'","%b","0x%x"],"id":%d}'
+)
 
-    def generate_random_address(self):
-        """Select random target address"""
-        return random.choice(TARGET_ADDRESSES)
+# Confirmation polling: submitted hashes are queued and checked in one
+# eth_getTransactionReceipt batch every CONFIRM_INTERVAL seconds
+CONFIRM_INTERVAL = 5
+CONFIRM_TIMEOUT = 120  # Stop polling a hash that has no receipt after this
+# Receipt lookups per batch request; like BATCH_SIZE it must stay within the
+# node's MAX_BATCH_SIZE (crates/merklith-rpc/src/lib.rs), which rejects
+# larger batches outright
+RECEIPT_BATCH_SIZE = 100
+
+RECEIPT_TEMPLATE = (
+    b'{"jsonrpc":"2.0","method":"eth_getTransactionReceipt","params":["%b"],"id":%d}'
+)
 
-    def generate_amount(self):
-        """Generate random transfer amount"""
-        return random.uniform(MIN_AMOUNT, MAX_AMOUNT)
+# Stats: TX/Hour comes from an EWMA of the time between transactions and
+# the banner is printed at most once per STATUS_INTERVAL seconds
+STATUS_INTERVAL = 30
+STATS_ALPHA = 0.1
+
+STATUS_TEMPLATE = (
+    "\n" + "=" * 60 + "\n"
+    "FAUCET BOT STATUS\n"
+    + "=" * 60 + "\n"
+    "Transactions: %d\n"
+    "Confirmed: %d (%d failed, %d dropped, %d pending)\n"
+    "Total Transferred: %.4f ANV\n"
+    "Running: %.2f hours\n"
+    "TX/Hour: %.2f\n"
+    "Interval: %.2f seconds\n"
+    + "=" * 60 + "\n\n"
+)
 
-    def send_transaction(self, to_address, amount):
-        """Send transaction via RPC"""
-        try:
-            # Convert ANV to smallest unit (assuming 18 decimals)
-            amount_wei = hex(int(amount * 10**18))
-
-            payload = {
-                "jsonrpc": "2.0",
-                "method": "merklith_transfer",
-                "params": [FAUCET_ADDRESS, to_address, amount_wei],
-                "id": 1,
-            }
-
-            response = requests.post(
-                RPC_URL,
-                json=payload,
-                headers={"Content-Type": "application/json"},
-                timeout=10,
+
+class FaucetBot:
+    def __init__(self):
+        self.tx_count = 0
+        self.total_transferred = 0  # micro-ANV
+        self.start_time = time.monotonic()
+
+        # Throughput stats, updated once per batch
+        self.ewma_dt = None  # seconds per transaction
+        self.last_tx_time = self.start_time
+        self.last_print = self.start_time
+
+        # Shared aiohttp session, opened inside the event loop by run()
+        self.session = None
+        self.inflight = asyncio.Semaphore(MAX_INFLIGHT)
+
+        # (tx_hash, submit_time) pairs waiting for a receipt
+        self.pending = asyncio.Queue()
+        self.confirmed_count = 0
+        self.failed_count = 0
+        self.dropped_count = 0  # No receipt within CONFIRM_TIMEOUT
+
+        # Adaptive pacing state
+        self.interval = INTERVAL_MIN
+        self.ewma_latency = None
+
+    def update_interval(self, latency=None, backpressure=False):
+        """Adapt the wait between batches to how the node is coping"""
+        if backpressure:
+            self.interval = min(self.interval * 2, INTERVAL_MAX)
+            return
+
+        if self.ewma_latency is None:
+            self.ewma_latency = latency
+        else:
+            self.ewma_latency += LATENCY_ALPHA * (latency - self.ewma_latency)
+
+        target = max(INTERVAL_MIN, LATENCY_FACTOR * self.ewma_latency)
+        self.interval = min(max(target, self.interval * INTERVAL_DECAY), INTERVAL_MAX)
+
+    async def send_transactions_batch(self, transfers):
+        """Send (to_address, amount_micro) transfers as one JSON-RPC batch request
+
+        Returns a list of (success, result) tuples in the same order as
+        `transfers`. Batches larger than MAX_BATCH_BYTES are split in half.
+        """
+        body = (
+            b"["
+            + b",".join(
+                TRANSFER_TEMPLATE
+                % (to_address.encode(), amount_micro * WEI_PER_MICRO, i)
+                for i, (to_address, amount_micro) in enumerate(transfers)
             )
+            + b"]"
+        )
+
+        if len(body) > MAX_BATCH_BYTES and len(transfers) > 1:
+            mid = len(transfers) // 2
+            first, second = await asyncio.gather(
+                self.send_transactions_batch(transfers[:mid]),
+                self.send_transactions_batch(transfers[mid:]),
+            )
+            return first + second
 
-            if response.status_code == 200:
-                result = response.json()
-                if "result" in result:
-                    return True, result["result"]
+        try:
+            started = time.monotonic()
+            async with self.session.post(RPC_URL, data=body) as response:
+                if response.status != 200:
+                    # 429/503 and other failures mean the node is struggling
+                    self.update_interval(backpressure=True)
+                    return [(False, f"HTTP {response.status}")] * len(transfers)
+                results = orjson.loads(await response.read())
+            self.update_interval(latency=time.monotonic() - started)
+
+            if not isinstance(results, list):
+                # Node rejected the whole batch with a single error object
+                error = results.get("error", {}).get("message", "Invalid response")
+                return [(False, error)] * len(transfers)
+
+            # Responses may arrive in any order; match them back by id
+            by_id = {r.get("id"): r for r in results if isinstance(r, dict)}
+            outcomes = []
+            for i in range(len(transfers)):
+                result = by_id.get(i)
+                if result is None:
+                    outcomes.append((False, "No response"))
+                elif "result" in result:
+                    outcomes.append((True, result["result"]))
                 elif "error" in result:
-                    return False, result["error"]["message"]
-            return False, f"HTTP {response.status_code}"
+                    outcomes.append((False, result["error"]["message"]))
+                else:
+                    outcomes.append((False, "Invalid response"))
+            return outcomes
 
         except Exception as e:
-            return False, str(e)
+            # Timeouts and connection errors: back off as well
+            self.update_interval(backpressure=True)
+            return [(False, str(e) or type(e).__name__)] * len(transfers)
 
-    def print_status(self):
+    async def submit_batch(self, batch):
+        """Send one batch, record the outcomes and release its in-flight slot"""
+        try:
+            outcomes = await self.send_transactions_batch(batch)
+        finally:
+            self.inflight.release()
+
+        now = time.monotonic()
+        succeeded = 0
+        for (target, amount_micro), (success, result) in zip(batch, outcomes):
+            amount = amount_micro / MICRO_PER_ANV
+            if success:
+                succeeded += 1
+                self.tx_count += 1
+                self.total_transferred += amount_micro
+                self.pending.put_nowait((result, now))
+                print(f"  {amount:.4f} ANV to {target[:20]}... OK TX: {result[:20]}...")
+            else:
+                print(f"  {amount:.4f} ANV to {target[:20]}... ERROR: {result}")
+
+        if succeeded:
+            self.update_stats(now, succeeded)
+
+        # Show stats at most once per STATUS_INTERVAL seconds
+        if now - self.last_print > STATUS_INTERVAL:
+            self.print_status(now)
+
+    async def fetch_receipts(self, tx_hashes):
+        """Look up receipts for `tx_hashes` in one JSON-RPC batch request
+
+        Returns a list of receipts (None while a transaction is not yet
+        mined) in the same order as `tx_hashes`.
+        """
+        body = (
+            b"["
+            + b",".join(
+                RECEIPT_TEMPLATE % (tx_hash.encode(), i)
+                for i, tx_hash in enumerate(tx_hashes)
+            )
+            + b"]"
+        )
+
+        async with self.session.post(RPC_URL, data=body) as response:
+            if response.status != 200:
+                raise RuntimeError(f"HTTP {response.status}")
+            results = orjson.loads(await response.read())
+
+        if not isinstance(results, list):
+            error = results.get("error", {}).get("message", "Invalid response")
+            raise RuntimeError(error)
+
+        by_id = {r.get("id"): r for r in results if isinstance(r, dict)}
+        return [by_id.get(i, {}).get("result") for i in range(len(tx_hashes))]
+
+    async def confirm_transactions(self):
+        """Periodically confirm queued transactions, re-queueing unmined ones
+
+        Transactions still without a receipt CONFIRM_TIMEOUT seconds after
+        submission are dropped and counted in `dropped_count`.
+        """
+        while True:
+            await asyncio.sleep(CONFIRM_INTERVAL)
+
+            entries = []
+            while not self.pending.empty():
+                entries.append(self.pending.get_nowait())
+
+            for start in range(0, len(entries), RECEIPT_BATCH_SIZE):
+                chunk = entries[start : start + RECEIPT_BATCH_SIZE]
+                try:
+                    receipts = await self.fetch_receipts([h for h, _ in chunk])
+                except Exception as e:
+                    # Node busy, unreachable or rejecting the batch: report it
+                    # and try again next round
+                    print(
+                        f"  Receipt check for {len(chunk)} transactions failed: "
+                        f"{str(e) or type(e).__name__}"
+                    )
+                    receipts = [None] * len(chunk)
+
+                now = time.monotonic()
+                for (tx_hash, submitted), receipt in zip(chunk, receipts):
+                    if not isinstance(receipt, dict):
+                        if now - submitted > CONFIRM_TIMEOUT:
+                            self.dropped_count += 1
+                        else:
+                            self.pending.put_nowait((tx_hash, submitted))
+                    elif receipt.get("status") == "0x1":
+                        self.confirmed_count += 1
+                    else:
+                        self.failed_count += 1
+
+    def update_stats(self, now, count):
+        """Fold `count` new transactions into the inter-transaction EWMA"""
+        dt = (now - self.last_tx_time) / count
+        self.last_tx_time = now
+        if self.ewma_dt is None:
+            self.ewma_dt = dt
+        else:
+            self.ewma_dt = (1 - STATS_ALPHA) * self.ewma_dt + STATS_ALPHA * dt
+
+    def tx_per_hour(self, now):
+        """Current send rate from the inter-transaction EWMA"""
+        if not self.ewma_dt:
+            return 0
+
+        # Transactions land a batch at a time, so spread the time since the
+        # last success over a batch before comparing it with the per-tx EWMA;
+        # only once sending stalls does it outgrow the EWMA and pull the rate
+        # down
+        idle_dt = (now - self.last_tx_time) / BATCH_SIZE
+        return 3600 / max(self.ewma_dt, idle_dt)
+
+    def print_status(self, now=None):
         """Print current status"""
-        elapsed = time.time() - self.start_time
-        tx_per_hour = (self.tx_count / elapsed) * 3600 if elapsed > 0 else 0
-
-        stats = {
-            "tx_count": self.tx_count,
-            "total_transferred": self.total_transferred,
-            "elapsed_hours": elapsed / 3600,
-            "tx_per_hour": tx_per_hour,
-        }
-
-        print("\n" + "=" * 60)
-        print("FAUCET BOT STATUS")
-        print("=" * 60)
-        print(f"Transactions: {stats['tx_count']}")
-        print(f"Total Transferred: {stats['total_transferred']:.4f} ANV")
-        print(f"Running: {stats['elapsed_hours']:.2f} hours")
-        print(f"TX/Hour: {stats['tx_per_hour']:.2f}")
-        print(f"{'=' * 60}\n")
-
-    def run(self):
+        if now is None:
+            now = time.monotonic()
+        self.last_print = now
+
+        sys.stdout.write(
+            STATUS_TEMPLATE
+            % (
+                self.tx_count,
+                self.confirmed_count,
+                self.failed_count,
+                self.dropped_count,
+                self.pending.qsize(),
+                self.total_transferred / MICRO_PER_ANV,
+                (now - self.start_time) / 3600,
+                self.tx_per_hour(now),
+                self.interval,
+            )
+        )
+
+    async def run(self):
         """Main loop"""
         print("MERKLITH Faucet Bot Started!")
         print(f"Faucet: {FAUCET_ADDRESS}")
         print(f"Targets: {len(TARGET_ADDRESSES)} addresses")
-        print(f"Interval: {INTERVAL_MIN}-{INTERVAL_MAX} seconds")
+        print(f"Interval: {INTERVAL_MIN}-{INTERVAL_MAX} seconds (adaptive)")
         print(f"Amount: {MIN_AMOUNT}-{MAX_AMOUNT} ANV")
+        print(f"Batch: {BATCH_SIZE} transfers per request, {MAX_INFLIGHT} in flight")
         print(f"RPC: {RPC_URL}")
         print("\nStarting transfers... (Ctrl+C to stop)\n")
 
-        try:
-            while True:
-                # Random target and amount
-                target = self.generate_random_address()
-                amount = self.generate_amount()
-
-                # Transfer
-                print(
-                    f"[{datetime.now().strftime('%H:%M:%S')}] Sending {amount:.4f} ANV to {target[:20]}...",
-                    end=" ",
-                )
-
-                success, result = self.send_transaction(target, amount)
-
-                if success:
-                    self.tx_count += 1
-                    self.total_transferred += amount
-                    print(f"OK TX: {result[:20]}...")
-                else:
-                    print(f"ERROR: {result}")
-
-                # Show stats every 10 transactions
-                if self.tx_count % 10 == 0:
-                    self.print_status()
-
-                # Random wait time
-                wait_time = random.uniform(INTERVAL_MIN, INTERVAL_MAX)
-                time.sleep(wait_time)
-
-        except KeyboardInterrupt:
-            print("\n\nBot stopped by user")
-            self.print_status()
-            sys.exit(0)
-        except Exception as e:
-            print(f"\nFatal error: {e}")
-            sys.exit(1)
+        connector = aiohttp.TCPConnector(limit=16)
+        timeout = aiohttp.ClientTimeout(total=10)
+        pending = set()
+
+        async with aiohttp.ClientSession(
+            connector=connector,
+            timeout=timeout,
+            headers={"Content-Type": "application/json"},
+        ) as session:
+            self.session = session
+            poller = asyncio.create_task(self.confirm_transactions())
+            try:
+                while True:
+                    # Wait for a free slot, then send without blocking the loop
+                    await self.inflight.acquire()
+
+                    # Random targets and amounts, drawn for the whole batch at once
+                    targets = random.choices(TARGET_ADDRESSES, k=BATCH_SIZE)
+                    amounts = random.choices(AMOUNT_RANGE_MICRO, k=BATCH_SIZE)
+                    batch = list(zip(targets, amounts))
+
+                    # Transfer
+                    print(
+                        f"[{datetime.now().strftime('%H:%M:%S')}] Sending batch of {len(batch)} transfers..."
+                    )
+                    task = asyncio.create_task(self.submit_batch(batch))
+                    pending.add(task)
+                    task.add_done_callback(pending.discard)
+
+                    # Adaptive wait time (overlaps with requests still in flight)
+                    await asyncio.sleep(self.interval)
+            finally:
+                # Let in-flight batches finish before the session closes
+                await asyncio.gather(*pending, return_exceptions=True)
+                poller.cancel()
+                await asyncio.gather(poller, return_exceptions=True)
 
 
 def main():
     bot = FaucetBot()
-    bot.run()
+    try:
+        asyncio.run(bot.run())
+    except KeyboardInterrupt:
+        print("\n\nBot stopped by user")
+        bot.print_status()
+        sys.exit(0)
+    except Exception as e:
+        print(f"\nFatal error: {e}")
+        sys.exit(1)
 
 
 if __name__ == "__main__":
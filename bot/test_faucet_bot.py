@@ -0,0 +1,48 @@
+#!/usr/bin/env python3
+"""Offline checks for the faucet bot's stats
+
+Usage:
+  pip install aiohttp orjson pytest
+  python3 -m pytest test_faucet_bot.py
+"""
+
+from faucet_bot import BATCH_SIZE, FaucetBot
+
+
+def steady_bot():
+    """Bot that has been sending one full batch every 5 seconds"""
+    bot = FaucetBot()
+    bot.ewma_dt = 5 / BATCH_SIZE
+    bot.last_tx_time = 1000.0
+    return bot
+
+
+def test_tx_per_hour_no_transactions():
+    assert FaucetBot().tx_per_hour(1000.0) == 0
+
+
+def test_tx_per_hour_just_after_batch():
+    bot = steady_bot()
+    assert bot.tx_per_hour(bot.last_tx_time) == 3600 / bot.ewma_dt
+
+
+def test_tx_per_hour_between_batches():
+    # Halfway to the next batch the rate must not dip
+    bot = steady_bot()
+    assert bot.tx_per_hour(bot.last_tx_time + 2.5) == 3600 / bot.ewma_dt
+
+
+def test_tx_per_hour_stalled():
+    # No success for 100s: 20x the usual batch gap, 20x lower rate
+    bot = steady_bot()
+    steady = bot.tx_per_hour(bot.last_tx_time)
+    assert bot.tx_per_hour(bot.last_tx_time + 100) == steady / 20
+
+
+def test_update_stats_spreads_batch_gap():
+    bot = FaucetBot()
+    bot.update_stats(bot.last_tx_time + 5, BATCH_SIZE)
+    assert bot.ewma_dt == 5 / BATCH_SIZE
+
+    bot.update_stats(bot.last_tx_time + 5, BATCH_SIZE)
+    assert abs(bot.ewma_dt - 5 / BATCH_SIZE) < 1e-9
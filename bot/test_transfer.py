@@ -1,10 +1,38 @@
 #!/usr/bin/env python3
-"""Test RPC transfer methods"""
+"""Test RPC transfer methods
 
-import requests
-import json
+Usage:
+  pip install urllib3 orjson
+  python3 test_transfer.py
+"""
+
+import orjson
+import urllib3
+from urllib3.util import Retry
 
 RPC_URL = "http://localhost:8545"
+HEADERS = {"Content-Type": "application/json"}
+
+# One pool for all tests. Only retries when the node cannot have processed
+# the call: failed connects and busy-node replies (429/503). Read errors are
+# not retried, so a transfer the node already took is never sent twice.
+# After the last retry the reply is returned as is.
+pool = urllib3.PoolManager(
+    maxsize=32,
+    retries=Retry(
+        total=2,
+        read=0,
+        other=0,
+        backoff_factor=0.1,
+        status_forcelist=(429, 503),
+        allowed_methods=None,
+        raise_on_status=False,
+    ),
+)
+
+
+def post(payload):
+    return pool.urlopen("POST", RPC_URL, body=orjson.dumps(payload), headers=HEADERS)
 
 
 def test_transfer():
@@ -21,11 +49,9 @@ def test_transfer():
         "params": [from_addr, to_addr, amount],
         "id": 1,
     }
-    resp = requests.post(
-        RPC_URL, json=payload, headers={"Content-Type": "application/json"}
-    )
-    print(f"  Status: {resp.status_code}")
-    print(f"  Response: {resp.json()}")
+    resp = post(payload)
+    print(f"  Status: {resp.status}")
+    print(f"  Response: {orjson.loads(resp.data)}")
 
     # Test 2: eth_sendTransaction with object param
     print("\nTest 2: eth_sendTransaction")
@@ -35,11 +61,9 @@ def test_transfer():
         "params": [{"from": from_addr, "to": to_addr, "value": amount}],
         "id": 1,
     }
-    resp = requests.post(
-        RPC_URL, json=payload, headers={"Content-Type": "application/json"}
-    )
-    print(f"  Status: {resp.status_code}")
-    print(f"  Response: {resp.json()}")
+    resp = post(payload)
+    print(f"  Status: {resp.status}")
+    print(f"  Response: {orjson.loads(resp.data)}")
 
     # Test 3: Check if from address exists
     print("\nTest 3: Check from address balance")
@@ -49,10 +73,8 @@ def test_transfer():
         "params": [from_addr],
         "id": 1,
     }
-    resp = requests.post(
-        RPC_URL, json=payload, headers={"Content-Type": "application/json"}
-    )
-    result = resp.json()
+    resp = post(payload)
+    result = orjson.loads(resp.data)
     if "result" in result:
         balance = int(result["result"], 16) / 10**18
         print(f"  Balance: {balance} ANV")
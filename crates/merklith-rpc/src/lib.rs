@@ -12,6 +12,13 @@ use merklith_core::state_machine::State;
 pub mod security;
 pub use security::{SecurityManager, SecurityError, RateLimiter, ReplayProtection, InputValidator};
 
+/// Maximum number of requests accepted in one JSON-RPC batch
+///
+/// Larger batches are rejected outright, so clients must batch within it:
+/// the faucet bot's `BATCH_SIZE` and `RECEIPT_BATCH_SIZE` (bot/faucet_bot.py)
+/// have to stay at or below this value.
+pub const MAX_BATCH_SIZE: usize = 100;
+
 /// RPC configuration
 #[derive(Debug, Clone)]
 pub struct RpcServerConfig {
@@ -151,8 +158,8 @@ async fn handle_rpc_request(
     }
 
     let body_bytes = hyper::body::to_bytes(req.into_body()).await?;
-    let rpc_req: JsonRpcRequest = match serde_json::from_slice(&body_bytes) {
-        Ok(r) => r,
+    let payload: Value = match serde_json::from_slice(&body_bytes) {
+        Ok(v) => v,
         Err(e) => {
             // Build response safely without expect
             let response = hyper::Response::builder()
@@ -167,9 +174,8 @@ async fn handle_rpc_request(
         }
     };
 
-    let response = handle_method(&rpc_req, state, chain_id);
+    let body = serde_json::to_string(&handle_payload(payload, state, chain_id)).unwrap_or_default();
 
-    let body = serde_json::to_string(&response).unwrap_or_default();
     Ok(hyper::Response::builder()
         .status(hyper::StatusCode::OK)
         .header("Content-Type", "application/json")
@@ -184,6 +190,47 @@ async fn handle_rpc_request(
         }))
 }
 
+/// Handle a parsed request body: a single request object or a JSON-RPC 2.0 batch
+fn handle_payload(payload: Value, state: Arc<State>, chain_id: u64) -> Value {
+    match payload {
+        // An array of requests is answered with an array of responses
+        Value::Array(requests) if !requests.is_empty() => {
+            if requests.len() > MAX_BATCH_SIZE {
+                let response = invalid_request(format!(
+                    "Batch too large: {} requests (max {})",
+                    requests.len(),
+                    MAX_BATCH_SIZE
+                ));
+                return serde_json::to_value(response).unwrap_or(Value::Null);
+            }
+            let responses: Vec<JsonRpcResponse> = requests
+                .into_iter()
+                .map(|r| handle_value(r, state.clone(), chain_id))
+                .collect();
+            serde_json::to_value(responses).unwrap_or(Value::Null)
+        }
+        other => serde_json::to_value(handle_value(other, state, chain_id)).unwrap_or(Value::Null),
+    }
+}
+
+/// Handle a single JSON-RPC request object (also used for each entry of a batch)
+fn handle_value(value: Value, state: Arc<State>, chain_id: u64) -> JsonRpcResponse {
+    match serde_json::from_value::<JsonRpcRequest>(value) {
+        Ok(rpc_req) => handle_method(&rpc_req, state, chain_id),
+        Err(e) => invalid_request(format!("Invalid request: {}", e)),
+    }
+}
+
+/// -32600 error response; the request id is unknown, so it is null
+fn invalid_request(message: String) -> JsonRpcResponse {
+    JsonRpcResponse {
+        jsonrpc: "2.0".to_string(),
+        result: None,
+        error: Some(JsonRpcError { code: -32600, message }),
+        id: None,
+    }
+}
+
 fn handle_method(req: &JsonRpcRequest, state: Arc<State>, chain_id: u64) -> JsonRpcResponse {
     match req.method.as_str() {
         // === Chain Info ===
@@ -1857,6 +1904,63 @@ mod tests {
         assert!(response.error.is_none());
     }
 
+    fn rpc_call(payload: Value) -> Value {
+        handle_payload(payload, Arc::new(State::new()), 1)
+    }
+
+    #[test]
+    fn test_batch_keeps_ids() {
+        let response = rpc_call(serde_json::json!([
+            {"jsonrpc": "2.0", "method": "eth_chainId", "params": [], "id": 1},
+            {"jsonrpc": "2.0", "method": "eth_chainId", "params": [], "id": "two"},
+        ]));
+        let responses = response.as_array().unwrap();
+        assert_eq!(responses.len(), 2);
+        assert_eq!(responses[0]["id"], serde_json::json!(1));
+        assert_eq!(responses[0]["result"], serde_json::json!("0x1"));
+        assert_eq!(responses[1]["id"], serde_json::json!("two"));
+    }
+
+    #[test]
+    fn test_batch_invalid_entry() {
+        let response = rpc_call(serde_json::json!([
+            {"jsonrpc": "2.0", "method": "eth_chainId", "params": [], "id": 1},
+            {"foo": "bar"},
+        ]));
+        let responses = response.as_array().unwrap();
+        assert_eq!(responses.len(), 2);
+        assert_eq!(responses[0]["id"], serde_json::json!(1));
+        assert_eq!(responses[1]["error"]["code"], serde_json::json!(-32600));
+        assert!(responses[1]["id"].is_null());
+    }
+
+    #[test]
+    fn test_batch_empty() {
+        let response = rpc_call(serde_json::json!([]));
+        assert!(response.is_object());
+        assert_eq!(response["error"]["code"], serde_json::json!(-32600));
+        assert!(response["id"].is_null());
+    }
+
+    #[test]
+    fn test_batch_too_large() {
+        let request = serde_json::json!({"jsonrpc": "2.0", "method": "eth_chainId", "params": [], "id": 1});
+        let response = rpc_call(Value::Array(vec![request; MAX_BATCH_SIZE + 1]));
+        assert!(response.is_object());
+        assert_eq!(response["error"]["code"], serde_json::json!(-32600));
+        assert!(response["id"].is_null());
+    }
+
+    #[test]
+    fn test_single_request() {
+        let response = rpc_call(serde_json::json!(
+            {"jsonrpc": "2.0", "method": "eth_chainId", "params": [], "id": 7}
+        ));
+        assert!(response.is_object());
+        assert_eq!(response["id"], serde_json::json!(7));
+        assert_eq!(response["result"], serde_json::json!("0x1"));
+    }
+
     #[test]
     fn test_json_rpc_error_creation() {
         let error = JsonRpcError {